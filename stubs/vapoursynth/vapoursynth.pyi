@@ -621,6 +621,32 @@ class Function:
     def __call__(self, *args: typing.Any, **kwargs: typing.Any) -> typing.Any: ...
 
 
+# implementation: akarin
+
+class _Plugin_akarin_Core_Bound(Plugin):
+    """
+    This class implements the module definitions for the corresponding VapourSynth plugin.
+    This class cannot be imported.
+    """
+    def Expr(self, clips: typing.Union["VideoNode", typing.Sequence["VideoNode"]], expr: typing.Union[str, bytes, bytearray, typing.Sequence[typing.Union[str, bytes, bytearray]]], format: typing.Optional[int] = None, opt: typing.Optional[int] = None, boundary: typing.Optional[int] = None) -> "VideoNode": ...
+    def PropExpr(self, clips: typing.Union["VideoNode", typing.Sequence["VideoNode"]], dict: typing.Callable[..., typing.Any]) -> "VideoNode": ...
+    def Select(self, clip_src: typing.Union["VideoNode", typing.Sequence["VideoNode"]], prop_src: typing.Union["VideoNode", typing.Sequence["VideoNode"]], expr: typing.Union[str, bytes, bytearray, typing.Sequence[typing.Union[str, bytes, bytearray]]]) -> "VideoNode": ...
+    def Text(self, clips: typing.Union["VideoNode", typing.Sequence["VideoNode"]], text: typing.Union[str, bytes, bytearray], alignment: typing.Optional[int] = None, scale: typing.Optional[int] = None, prop: typing.Union[str, bytes, bytearray, None] = None, strict: typing.Optional[int] = None, vspipe: typing.Optional[int] = None) -> "VideoNode": ...
+
+
+class _Plugin_akarin_VideoNode_Bound(Plugin):
+    """
+    This class implements the module definitions for the corresponding VapourSynth plugin.
+    This class cannot be imported.
+    """
+    def Expr(self, expr: typing.Union[str, bytes, bytearray, typing.Sequence[typing.Union[str, bytes, bytearray]]], format: typing.Optional[int] = None, opt: typing.Optional[int] = None, boundary: typing.Optional[int] = None) -> "VideoNode": ...
+    def PropExpr(self, dict: typing.Callable[..., typing.Any]) -> "VideoNode": ...
+    def Select(self, prop_src: typing.Union["VideoNode", typing.Sequence["VideoNode"]], expr: typing.Union[str, bytes, bytearray, typing.Sequence[typing.Union[str, bytes, bytearray]]]) -> "VideoNode": ...
+    def Text(self, text: typing.Union[str, bytes, bytearray], alignment: typing.Optional[int] = None, scale: typing.Optional[int] = None, prop: typing.Union[str, bytes, bytearray, None] = None, strict: typing.Optional[int] = None, vspipe: typing.Optional[int] = None) -> "VideoNode": ...
+
+# end implementation
+
+
 # implementation: resize
 
 class _Plugin_resize_Core_Bound(Plugin):
@@ -949,6 +975,13 @@ class _Plugin_warpsf_VideoNode_Bound(Plugin):
 
 
 class VideoNode:
+# instance_bound_VideoNode: akarin
+    @property
+    def akarin(self) -> _Plugin_akarin_VideoNode_Bound:
+        """
+        Akarin's Expression Filter
+        """
+# end instance
 # instance_bound_VideoNode: resize
     @property
     def resize(self) -> _Plugin_resize_VideoNode_Bound:
@@ -1089,6 +1122,13 @@ class LogHandle:
 
 
 class Core:
+# instance_bound_Core: akarin
+    @property
+    def akarin(self) -> _Plugin_akarin_Core_Bound:
+        """
+        Akarin's Expression Filter
+        """
+# end instance
 # instance_bound_Core: resize
     @property
     def resize(self) -> _Plugin_resize_Core_Bound:
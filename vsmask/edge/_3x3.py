@@ -24,43 +24,61 @@ __all__ = [
 
 import math
 from abc import ABC
+from functools import cache
 from typing import NoReturn, Sequence, Tuple
 
 import vapoursynth as vs
-from vsutil import Range, depth, get_depth, join, split
+from vsutil import Range, depth, get_depth
 
 from ..util import XxpandMode, expand, inpand
-from ._abstract import EdgeDetect, EuclidianDistance, MatrixEdgeDetect, Max, RidgeDetect, SingleMatrix
+from ._abstract import (
+    EdgeDetect, EuclidianDistance, MatrixEdgeDetect, Max, RidgeDetect, SingleMatrix, _conv_rpn, _shared_f32,
+    _TCannyEdgeDetect
+)
 
 
 class Matrix3x3(EdgeDetect, ABC):
     ...
 
 
+_SQRT2 = math.sqrt(2)
+
+
+@cache
+def _half_float_supported() -> bool:
+    """Whether this core's std.Convolution/std.Expr accept 16-bit float clips."""
+    blank = vs.core.std.BlankClip(format=vs.GRAYH, width=8, height=8, length=1)
+    try:
+        vs.core.std.Expr(blank.std.Convolution([1] * 9), 'x sqrt')
+    except vs.Error:
+        return False
+    return True
+
+
 # Single matrix
 class Laplacian1(SingleMatrix, Matrix3x3):
     """Pierre-Simon de Laplace operator 1st implementation."""
-    matrices = [[0, -1, 0, -1, 4, -1, 0, -1, 0]]
+    matrices = ((0, -1, 0, -1, 4, -1, 0, -1, 0),)
 
 
 class Laplacian2(SingleMatrix, Matrix3x3):
     """Pierre-Simon de Laplace operator 2nd implementation."""
-    matrices = [[1, -2, 1, -2, 4, -2, 1, -2, 1]]
+    matrices = ((1, -2, 1, -2, 4, -2, 1, -2, 1),)
 
 
 class Laplacian3(SingleMatrix, Matrix3x3):
     """Pierre-Simon de Laplace operator 3rd implementation."""
-    matrices = [[2, -1, 2, -1, -4, -1, 2, -1, 2]]
+    matrices = ((2, -1, 2, -1, -4, -1, 2, -1, 2),)
 
 
 class Laplacian4(SingleMatrix, Matrix3x3):
     """Pierre-Simon de Laplace operator 4th implementation."""
-    matrices = [[-1, -1, -1, -1, 8, -1, -1, -1, -1]]
+    matrices = ((-1, -1, -1, -1, 8, -1, -1, -1, -1),)
 
 
 class Kayyali(SingleMatrix, Matrix3x3):
     """Kayyali operator."""
-    matrices = [[6, 0, -6, 0, 0, 0, -6, 0, 6]]
+    matrices = ((6, 0, -6, 0, 0, 0, -6, 0, 6),)
 
 
 # Euclidian Distance
@@ -69,22 +87,18 @@ class Tritical(RidgeDetect, EuclidianDistance, Matrix3x3):
     Operator used in Tritical's original TCanny filter.
     Plain and simple orthogonal first order derivative.
     """
-    matrices = [
-        [0, 0, 0, -1, 0, 1, 0, 0, 0],
-        [0, 1, 0, 0, 0, 0, 0, -1, 0]
-    ]
+    matrices = (
+        (0, 0, 0, -1, 0, 1, 0, 0, 0),
+        (0, 1, 0, 0, 0, 0, 0, -1, 0)
+    )
 
 
-class TriticalTCanny(Matrix3x3, EdgeDetect):
+class TriticalTCanny(_TCannyEdgeDetect, Matrix3x3):
     """
     Operator used in Tritical's original TCanny filter.
     Plain and simple orthogonal first order derivative.
     """
-    def _compute_edge_mask(self, clip: vs.VideoNode) -> vs.VideoNode:
-        return clip.tcanny.TCanny(0, mode=1, op=0)
-
-    def _compute_ridge_mask(self, clip: vs.VideoNode) -> vs.VideoNode:
-        raise NotImplementedError
+    _op = 0
 
 
 class Cross(RidgeDetect, EuclidianDistance, Matrix3x3):
@@ -92,18 +106,22 @@ class Cross(RidgeDetect, EuclidianDistance, Matrix3x3):
     "HotDoG" Operator from AVS ExTools by Dogway.
     Plain and simple cross first order derivative.
     """
-    matrices = [
-        [1, 0, 0, 0, 0, 0, 0, 0, -1],
-        [0, 0, -1, 0, 0, 0, 1, 0, 0]
-    ]
+    matrices = (
+        (1, 0, 0, 0, 0, 0, 0, 0, -1),
+        (0, 0, -1, 0, 0, 0, 1, 0, 0)
+    )
 
 
 class Prewitt(RidgeDetect, EuclidianDistance, Matrix3x3):
     """Judith M. S. Prewitt operator."""
-    matrices = [
-        [1, 0, -1, 1, 0, -1, 1, 0, -1],
-        [1, 1, 1, 0, 0, 0, -1, -1, -1]
-    ]
+    matrices = (
+        (1, 0, -1, 1, 0, -1, 1, 0, -1),
+        (1, 1, 1, 0, 0, 0, -1, -1, -1)
+    )
+    sep_matrices = (
+        ((1, 0, -1), (1, 1, 1)),
+        ((1, 1, 1), (1, 0, -1))
+    )
 
 
 class PrewittStd(Matrix3x3, EdgeDetect):
@@ -115,21 +133,22 @@ class PrewittStd(Matrix3x3, EdgeDetect):
         raise NotImplementedError
 
 
-class PrewittTCanny(Matrix3x3, EdgeDetect):
+class PrewittTCanny(_TCannyEdgeDetect, Matrix3x3):
     """Judith M. S. Prewitt TCanny plugin operator."""
-    def _compute_edge_mask(self, clip: vs.VideoNode) -> vs.VideoNode:
-        return clip.tcanny.TCanny(0, mode=1, op=1, scale=2)
-
-    def _compute_ridge_mask(self, clip: vs.VideoNode) -> vs.VideoNode:
-        raise NotImplementedError
+    _op = 1
+    _scale = 2
 
 
 class Sobel(RidgeDetect, EuclidianDistance, Matrix3x3):
     """Sobel–Feldman operator."""
-    matrices = [
-        [1, 0, -1, 2, 0, -2, 1, 0, -1],
-        [1, 2, 1, 0, 0, 0, -1, -2, -1]
-    ]
+    matrices = (
+        (1, 0, -1, 2, 0, -2, 1, 0, -1),
+        (1, 2, 1, 0, 0, 0, -1, -2, -1)
+    )
+    sep_matrices = (
+        ((1, 0, -1), (1, 2, 1)),
+        ((1, 2, 1), (1, 0, -1))
+    )
 
 
 class SobelStd(Matrix3x3, EdgeDetect):
@@ -141,17 +160,16 @@ class SobelStd(Matrix3x3, EdgeDetect):
         raise NotImplementedError
 
 
-class SobelTCanny(Matrix3x3, EdgeDetect):
+class SobelTCanny(_TCannyEdgeDetect, Matrix3x3):
     """Sobel–Feldman Vapoursynth plugin operator."""
-    def _compute_edge_mask(self, clip: vs.VideoNode) -> vs.VideoNode:
-        return clip.tcanny.TCanny(0, mode=1, op=2, scale=2)
-
-    def _compute_ridge_mask(self, clip: vs.VideoNode) -> vs.VideoNode:
-        raise NotImplementedError
+    _op = 2
+    _scale = 2
 
 
 class ASobel(Matrix3x3, EdgeDetect):
     """Modified Sobel–Feldman operator from AWarpSharp."""
+    _plugin = 'warp'
+
     def _compute_edge_mask(self, clip: vs.VideoNode) -> vs.VideoNode:
         # warp.ASobel and warpsf.ASobel have different function signatures
         # so mypy set the ternary expression as Callable[..., Any]
@@ -172,11 +190,15 @@ class Scharr(RidgeDetect, EuclidianDistance, Matrix3x3):
     Original H. Scharr optimised operator which attempts
     to achieve the perfect rotational symmetry with coefficients 3 and 10.
     """
-    matrices = [
-        [-3, 0, 3, -10, 0, 10, -3, 0, 3],
-        [-3, -10, -3, 0, 0, 0, 3, 10, 3]
-    ]
-    divisors = [3, 3]
+    matrices = (
+        (-3, 0, 3, -10, 0, 10, -3, 0, 3),
+        (-3, -10, -3, 0, 0, 0, 3, 10, 3)
+    )
+    divisors = (3, 3)
+    sep_matrices = (
+        ((-1, 0, 1), (3, 10, 3)),
+        ((3, 10, 3), (-1, 0, 1))
+    )
 
 
 class RScharr(RidgeDetect, EuclidianDistance, Matrix3x3):
@@ -184,76 +206,88 @@ class RScharr(RidgeDetect, EuclidianDistance, Matrix3x3):
     Refined H. Scharr operator to more accurately calculate
     1st derivatives for a 3x3 kernel with coeffs 47 and 162.
     """
-    matrices = [
-        [-47, 0, 47, -162, 0, 162, -47, 0, 47],
-        [-47, -162, -47, 0, 0, 0, 47, 162, 47]
-    ]
-    divisors = [47, 47]
-
-
-class ScharrTCanny(Matrix3x3, EdgeDetect):
+    matrices = (
+        (-47, 0, 47, -162, 0, 162, -47, 0, 47),
+        (-47, -162, -47, 0, 0, 0, 47, 162, 47)
+    )
+    divisors = (47, 47)
+    sep_matrices = (
+        ((-1, 0, 1), (47, 162, 47)),
+        ((47, 162, 47), (-1, 0, 1))
+    )
+
+
+class ScharrTCanny(_TCannyEdgeDetect, Matrix3x3):
     """H. Scharr optimised TCanny Vapoursynth plugin operator."""
-    def _compute_edge_mask(self, clip: vs.VideoNode) -> vs.VideoNode:
-        return clip.tcanny.TCanny(0, mode=1, op=2, scale=4 / 3)
-
-    def _compute_ridge_mask(self, clip: vs.VideoNode) -> vs.VideoNode:
-        raise NotImplementedError
+    _op = 2
+    _scale = 4 / 3
 
 
 class Kroon(RidgeDetect, EuclidianDistance, Matrix3x3):
     """Dirk-Jan Kroon operator."""
-    matrices = [
-        [-17, 0, 17, -61, 0, 61, -17, 0, 17],
-        [-17, -61, -17, 0, 0, 0, 17, 61, 17]
-    ]
-    divisors = [17, 17]
-
-
-class KroonTCanny(Matrix3x3, EdgeDetect):
+    matrices = (
+        (-17, 0, 17, -61, 0, 61, -17, 0, 17),
+        (-17, -61, -17, 0, 0, 0, 17, 61, 17)
+    )
+    divisors = (17, 17)
+    sep_matrices = (
+        ((-1, 0, 1), (17, 61, 17)),
+        ((17, 61, 17), (-1, 0, 1))
+    )
+
+
+class KroonTCanny(_TCannyEdgeDetect, Matrix3x3):
     """Dirk-Jan Kroon TCanny Vapoursynth plugin operator."""
-    def _compute_edge_mask(self, clip: vs.VideoNode) -> vs.VideoNode:
-        return clip.tcanny.TCanny(0, mode=1, op=4, scale=1 / 17)
-
-    def _compute_ridge_mask(self, clip: vs.VideoNode) -> vs.VideoNode:
-        raise NotImplementedError
+    _op = 4
+    _scale = 1 / 17
 
 
 class FreyChen(MatrixEdgeDetect):
     """Chen Frei operator. 3x3 matrices properly implemented."""
-    sqrt2 = math.sqrt(2)
-    matrices = [
-        [1, sqrt2, 1, 0, 0, 0, -1, -sqrt2, -1],
-        [1, 0, -1, sqrt2, 0, -sqrt2, 1, 0, -1],
-        [0, -1, sqrt2, 1, 0, -1, -sqrt2, 1, 0],
-        [sqrt2, -1, 0, -1, 0, 1, 0, 1, -sqrt2],
-        [0, 1, 0, -1, 0, -1, 0, 1, 0],
-        [-1, 0, 1, 0, 0, 0, 1, 0, -1],
-        [1, -2, 1, -2, 4, -2, 1, -2, 1],
-        [-2, 1, -2, 1, 4, 1, -2, 1, -2],
-        [1, 1, 1, 1, 1, 1, 1, 1, 1]
-    ]
-    divisors = [
-        2 * sqrt2,
-        2 * sqrt2,
-        2 * sqrt2,
-        2 * sqrt2,
-        2,
-        2,
-        6,
-        6,
-        3
-    ]
+    matrices = (
+        (1, _SQRT2, 1, 0, 0, 0, -1, -_SQRT2, -1),
+        (1, 0, -1, _SQRT2, 0, -_SQRT2, 1, 0, -1),
+        (0, -1, _SQRT2, 1, 0, -1, -_SQRT2, 1, 0),
+        (_SQRT2, -1, 0, -1, 0, 1, 0, 1, -_SQRT2),
+        (0, 1, 0, -1, 0, -1, 0, 1, 0),
+        (-1, 0, 1, 0, 0, 0, 1, 0, -1),
+        (1, -2, 1, -2, 4, -2, 1, -2, 1),
+        (-2, 1, -2, 1, 4, 1, -2, 1, -2),
+        (1, 1, 1, 1, 1, 1, 1, 1, 1)
+    )
+    divisors = (2 * _SQRT2,) * 4 + (2.0, 2.0, 6.0, 6.0, 3.0)
+    # sqrt(M / (M + S)) is invariant under common scaling of the nine basis
+    # convolutions: a multi folded into the divisors would simply cancel.
+    _linear_merge = False
 
     def _preprocess(self, clip: vs.VideoNode) -> vs.VideoNode:
-        return depth(clip, 32)
+        # A mask doesn't need full FP32 accuracy: running the nine-convolution
+        # pipeline in half floats halves its bandwidth on cores that allow it.
+        if _half_float_supported():
+            return depth(clip, 16, sample_type=vs.FLOAT)
+        return _shared_f32(clip)
 
     def _postprocess(self, clip: vs.VideoNode) -> vs.VideoNode:
         return depth(clip, self._bits, range=Range.FULL, range_in=Range.FULL)
 
+    # M is computed once and duplicated on the stack rather than inlined
+    # twice: Expr performs no common subexpression elimination.
+    _M = 'x dup * y dup * + z dup * + a dup * +'
+    _merge_expr = f'{_M} dup b dup * c dup * + d dup * + e dup * + f dup * + + / sqrt'
+
+    def _compute_edge_mask(self, clip: vs.VideoNode) -> vs.VideoNode:
+        if hasattr(vs.core, 'akarin'):
+            # The nine basis projections and the sqrt(M / (M + S)) merge in one
+            # pass over the 3x3 window, instead of nine convolution passes
+            # plus a nine-input Expr.
+            g = [f'{_conv_rpn(mat, div)} dup *' for mat, div in zip(self.matrices, self.divisors)]
+            m = g[0] + ''.join(f' {t} +' for t in g[1:4])
+            s = g[4] + ''.join(f' {t} +' for t in g[5:])
+            return vs.core.akarin.Expr(clip, self._fuse_postexpr(f'{m} dup {s} + / sqrt'))
+        return super()._compute_edge_mask(clip)
+
     def _merge_edge(self, clips: Sequence[vs.VideoNode]) -> vs.VideoNode:
-        M = 'x x * y y * + z z * + a a * +'
-        S = f'b b * c c * + d d * + e e * + f f * + {M} +'
-        return vs.core.std.Expr(clips, f'{M} {S} / sqrt')
+        return vs.core.std.Expr(clips, self._fuse_postexpr(self._merge_expr))
 
     def _merge_ridge(self, clips: Sequence[vs.VideoNode]) -> vs.VideoNode | NoReturn:
         raise NotImplementedError
@@ -261,66 +295,69 @@ class FreyChen(MatrixEdgeDetect):
 
 class FreyChenG41(RidgeDetect, EuclidianDistance, Matrix3x3):
     """"Chen Frei" operator. 3x3 matrices from G41Fun."""
-    matrices = [
-        [-7, 0, 7, -10, 0, 10, -7, 0, 7],
-        [-7, -10, -7, 0, 0, 0, 7, 10, 7]
-    ]
-    divisors = [7, 7]
+    matrices = (
+        (-7, 0, 7, -10, 0, 10, -7, 0, 7),
+        (-7, -10, -7, 0, 0, 0, 7, 10, 7)
+    )
+    divisors = (7, 7)
+    sep_matrices = (
+        ((-1, 0, 1), (7, 10, 7)),
+        ((7, 10, 7), (-1, 0, 1))
+    )
 
 
 # Max
 class Robinson3(Max, Matrix3x3):
     """Robinson compass operator level 3."""
-    matrices = [
-        [1, 1, 1, 0, 0, 0, -1, -1, -1],
-        [1, 1, 0, 1, 0, -1, 0, -1, -1],
-        [1, 0, -1, 1, 0, -1, 1, 0, -1],
-        [0, -1, -1, 1, 0, -1, 1, 1, 0]
-    ]
+    matrices = (
+        (1, 1, 1, 0, 0, 0, -1, -1, -1),
+        (1, 1, 0, 1, 0, -1, 0, -1, -1),
+        (1, 0, -1, 1, 0, -1, 1, 0, -1),
+        (0, -1, -1, 1, 0, -1, 1, 1, 0)
+    )
 
 
 class Robinson5(Max, Matrix3x3):
     """Robinson compass operator level 5."""
-    matrices = [
-        [1, 2, 1, 0, 0, 0, -1, -2, -1],
-        [2, 1, 0, 1, 0, -1, 0, -1, -2],
-        [1, 0, -1, 2, 0, -2, 1, 0, -1],
-        [0, -1, -2, 1, 0, -1, 2, 1, 0]
-    ]
+    matrices = (
+        (1, 2, 1, 0, 0, 0, -1, -2, -1),
+        (2, 1, 0, 1, 0, -1, 0, -1, -2),
+        (1, 0, -1, 2, 0, -2, 1, 0, -1),
+        (0, -1, -2, 1, 0, -1, 2, 1, 0)
+    )
 
 
 class TheToof(Max, Matrix3x3):
     """TheToof compass operator from SharpAAMCmod."""
-    matrices = [
-        [5, 10, 5, 0, 0, 0, -5, -10, -5],
-        [10, 5, 0, 5, 0, -5, 0, -5, -10],
-        [5, 0, -5, 10, 0, -10, 5, 0, -5],
-        [0, -5, -10, 5, 0, -5, 10, 5, 0]
-    ]
-    divisors = [4] * 4
+    matrices = (
+        (5, 10, 5, 0, 0, 0, -5, -10, -5),
+        (10, 5, 0, 5, 0, -5, 0, -5, -10),
+        (5, 0, -5, 10, 0, -10, 5, 0, -5),
+        (0, -5, -10, 5, 0, -5, 10, 5, 0)
+    )
+    divisors = (4,) * 4
 
 
 class Kirsch(Max, Matrix3x3):
     """Russell Kirsch compass operator."""
-    matrices = [
-        [5, 5, 5, -3, 0, -3, -3, -3, -3],
-        [5, 5, -3, 5, 0, -3, -3, -3, -3],
-        [5, -3, -3, 5, 0, -3, 5, -3, -3],
-        [-3, -3, -3, 5, 0, -3, 5, 5, -3],
-        [-3, -3, -3, -3, 0, -3, 5, 5, 5],
-        [-3, -3, -3, -3, 0, 5, -3, 5, 5],
-        [-3, -3, 5, -3, 0, 5, -3, -3, 5],
-        [-3, 5, 5, -3, 0, 5, -3, -3, -3]
-    ]
-
-
-class KirschTCanny(Matrix3x3, EdgeDetect):
+    # All eight rotations are needed here: with the 5/-3 weighting, opposite
+    # directions are 180-degree rotations but not negations of each other,
+    # so the 4-kernel + saturate=False folding used by Robinson can't apply.
+    matrices = (
+        (5, 5, 5, -3, 0, -3, -3, -3, -3),
+        (5, 5, -3, 5, 0, -3, -3, -3, -3),
+        (5, -3, -3, 5, 0, -3, 5, -3, -3),
+        (-3, -3, -3, 5, 0, -3, 5, 5, -3),
+        (-3, -3, -3, -3, 0, -3, 5, 5, 5),
+        (-3, -3, -3, -3, 0, 5, -3, 5, 5),
+        (-3, -3, 5, -3, 0, 5, -3, -3, 5),
+        (-3, 5, 5, -3, 0, 5, -3, -3, -3)
+    )
+
+
+class KirschTCanny(_TCannyEdgeDetect, Matrix3x3):
     """Russell Kirsch compass TCanny Vapoursynth plugin operator."""
-    def _compute_edge_mask(self, clip: vs.VideoNode) -> vs.VideoNode:
-        return clip.tcanny.TCanny(0, mode=1, op=5)
-
-    def _compute_ridge_mask(self, clip: vs.VideoNode) -> vs.VideoNode:
-        raise NotImplementedError
+    _op = 5
 
 
 # Misc
@@ -336,16 +373,34 @@ class MinMax(EdgeDetect):
         super().__init__()
         self.radii = (rady, radc, radc)
 
+    def _memo_key(self) -> Tuple[int, int, int]:
+        return self.radii
+
     def _compute_edge_mask(self, clip: vs.VideoNode) -> vs.VideoNode:
         assert clip.format
-        planes = [
-            vs.core.std.Expr(
-                [expand(p, rad, rad, XxpandMode.ELLIPSE),
-                 inpand(p, rad, rad, XxpandMode.ELLIPSE)],
+        rady, radc = self.radii[0], self.radii[1]
+        if rady == radc or clip.format.num_planes == 1:
+            # Single radius: no need for a split/join roundtrip
+            return vs.core.std.Expr(
+                [expand(clip, rady, rady, XxpandMode.ELLIPSE),
+                 inpand(clip, rady, rady, XxpandMode.ELLIPSE)],
                 'x y -')
-            for p, rad in zip(split(clip), self.radii)
-        ]
-        return join(planes, clip.format.color_family)
+        if radc == 0:
+            # Radius 0 boils down to `x x -`: run the morphology on luma only
+            # and zero the chroma planes in the same Expr, again without any
+            # split/join graph nodes
+            return vs.core.std.Expr(
+                [expand(clip, rady, rady, XxpandMode.ELLIPSE, planes=0),
+                 inpand(clip, rady, rady, XxpandMode.ELLIPSE, planes=0)],
+                ['x y -', '0'])
+        # Mixed radii: run the luma and chroma morphology as plane-selective
+        # passes on the full clip and subtract everything in one Expr,
+        # instead of a split/join roundtrip with three subtraction nodes
+        dil = expand(expand(clip, rady, rady, XxpandMode.ELLIPSE, planes=0),
+                     radc, radc, XxpandMode.ELLIPSE, planes=[1, 2])
+        ero = inpand(inpand(clip, rady, rady, XxpandMode.ELLIPSE, planes=0),
+                     radc, radc, XxpandMode.ELLIPSE, planes=[1, 2])
+        return vs.core.std.Expr([dil, ero], 'x y -')
 
     def _compute_ridge_mask(self, clip: vs.VideoNode) -> vs.VideoNode:
         raise NotImplementedError
@@ -19,7 +19,9 @@ from typing import Sequence
 import vapoursynth as vs
 from vsutil import Range, depth
 
-from ._abstract import EdgeDetect, EuclidianDistance, Max, RidgeDetect, SingleMatrix
+from ._abstract import (
+    EdgeDetect, EuclidianDistance, Max, RidgeDetect, SingleMatrix, _conv_rpn, _shared_f32, _TCannyEdgeDetect
+)
 
 
 class Matrix5x5(EdgeDetect, ABC):
@@ -29,99 +31,127 @@ class Matrix5x5(EdgeDetect, ABC):
 # Single matrix
 class ExLaplacian1(SingleMatrix, Matrix5x5):
     """Extended Pierre-Simon de Laplace operator, 1st implementation."""
-    matrices = [[0, 0, -1, 0, 0, 0, 0, -1, 0, 0, -1, -1, 8, -1, -1, 0, 0, -1, 0, 0, 0, 0, -1, 0, 0]]
+    matrices = ((0, 0, -1, 0, 0, 0, 0, -1, 0, 0, -1, -1, 8, -1, -1, 0, 0, -1, 0, 0, 0, 0, -1, 0, 0),)
 
 
 class ExLaplacian2(SingleMatrix, Matrix5x5):
     """Extended Pierre-Simon de Laplace operator, 2nd implementation."""
-    matrices = [[0, 1, -1, 1, 0, 1, 1, -4, 1, 1, -1, -4, 8, -4, -1, 1, 1, -4, 1, 1, 0, 1, -1, 1, 0]]
+    matrices = ((0, 1, -1, 1, 0, 1, 1, -4, 1, 1, -1, -4, 8, -4, -1, 1, 1, -4, 1, 1, 0, 1, -1, 1, 0),)
 
 
 class ExLaplacian3(SingleMatrix, Matrix5x5):
     """Extended Pierre-Simon de Laplace operator, 3rd implementation."""
-    matrices = [[-1, 1, -1, 1, -1, 1, 2, -4, 2, 1, -1, -4, 8, -4, -1, 1, 2, -4, 2, 1, -1, 1, -1, 1, -1]]
+    matrices = ((-1, 1, -1, 1, -1, 1, 2, -4, 2, 1, -1, -4, 8, -4, -1, 1, 2, -4, 2, 1, -1, 1, -1, 1, -1),)
 
 
 class ExLaplacian4(SingleMatrix, Matrix5x5):
     """Extended Pierre-Simon de Laplace operator, 4th implementation."""
-    matrices = [[-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 24, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1]]
+    matrices = ((-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 24, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),)
 
 
 class LoG(SingleMatrix, Matrix5x5):
     """Laplacian of Gaussian operator."""
-    matrices = [[0, 0, -1, 0, 0, 0, -1, -2, -1, 0, -1, -2, 16, -2, -1, 0, -1, -2, -1, 0, 0, 0, -1, 0, 0]]
+    matrices = ((0, 0, -1, 0, 0, 0, -1, -2, -1, 0, -1, -2, 16, -2, -1, 0, -1, -2, -1, 0, 0, 0, -1, 0, 0),)
 
 
 # Euclidian distance
 class ExPrewitt(RidgeDetect, EuclidianDistance, Matrix5x5):
     """Extended Judith M. S. Prewitt operator."""
-    matrices = [
-        [2, 1, 0, -1, -2, 2, 1, 0, -1, -2, 2, 1, 0, -1, -2, 2, 1, 0, -1, -2, 2, 1, 0, -1, -2],
-        [2, 2, 2, 2, 2, 1, 1, 1, 1, 1, 0, 0, 0, 0, 0, -1, -1, -1, -1, -1, -2, -2, -2, -2, -2]
-    ]
+    matrices = (
+        (2, 1, 0, -1, -2, 2, 1, 0, -1, -2, 2, 1, 0, -1, -2, 2, 1, 0, -1, -2, 2, 1, 0, -1, -2),
+        (2, 2, 2, 2, 2, 1, 1, 1, 1, 1, 0, 0, 0, 0, 0, -1, -1, -1, -1, -1, -2, -2, -2, -2, -2)
+    )
+    sep_matrices = (
+        ((2, 1, 0, -1, -2), (1, 1, 1, 1, 1)),
+        ((1, 1, 1, 1, 1), (2, 1, 0, -1, -2))
+    )
 
 
 class ExSobel(RidgeDetect, EuclidianDistance, Matrix5x5):
     """Extended Sobel–Feldman operator."""
-    matrices = [
-        [2, 1, 0, -1, -2, 2, 1, 0, -1, -2, 4, 2, 0, -2, -4, 2, 1, 0, -1, -2, 2, 1, 0, -1, -2],
-        [2, 2, 4, 2, 2, 1, 1, 2, 1, 1, 0, 0, 0, 0, 0, -1, -1, -2, -1, -1, -2, -2, -4, -2, -2]
-    ]
+    matrices = (
+        (2, 1, 0, -1, -2, 2, 1, 0, -1, -2, 4, 2, 0, -2, -4, 2, 1, 0, -1, -2, 2, 1, 0, -1, -2),
+        (2, 2, 4, 2, 2, 1, 1, 2, 1, 1, 0, 0, 0, 0, 0, -1, -1, -2, -1, -1, -2, -2, -4, -2, -2)
+    )
+    sep_matrices = (
+        ((2, 1, 0, -1, -2), (1, 1, 2, 1, 1)),
+        ((1, 1, 2, 1, 1), (2, 1, 0, -1, -2))
+    )
 
 
 class FDoG(RidgeDetect, EuclidianDistance, Matrix5x5):
     """Flow-based Difference of Gaussian"""
-    matrices = [
-        [1, 1, 0, -1, -1, 2, 2, 0, -2, -2, 3, 3, 0, -3, -3, 2, 2, 0, -2, -2, 1, 1, 0, -1, -1],
-        [1, 2, 3, 2, 1, 1, 2, 3, 2, 1, 0, 0, 0, 0, 0, -1, -2, -3, -2, -1, -1, -2, -3, -2, -1]
-    ]
-    divisors = [2, 2]
-
-
-class FDoGTCanny(Matrix5x5, EdgeDetect):
+    matrices = (
+        (1, 1, 0, -1, -1, 2, 2, 0, -2, -2, 3, 3, 0, -3, -3, 2, 2, 0, -2, -2, 1, 1, 0, -1, -1),
+        (1, 2, 3, 2, 1, 1, 2, 3, 2, 1, 0, 0, 0, 0, 0, -1, -2, -3, -2, -1, -1, -2, -3, -2, -1)
+    )
+    divisors = (2, 2)
+    sep_matrices = (
+        ((1, 1, 0, -1, -1), (1, 2, 3, 2, 1)),
+        ((1, 2, 3, 2, 1), (1, 1, 0, -1, -1))
+    )
+
+
+class FDoGTCanny(_TCannyEdgeDetect, Matrix5x5):
     """Flow-based Difference of Gaussian TCanny Vapoursynth plugin."""
-    def _compute_edge_mask(self, clip: vs.VideoNode) -> vs.VideoNode:
-        return clip.tcanny.TCanny(0, mode=1, op=6, scale=0.5)
-
-    def _compute_ridge_mask(self, clip: vs.VideoNode) -> vs.VideoNode:
-        raise NotImplementedError
+    _op = 6
+    _scale = 0.5
 
 
 class DoG(EuclidianDistance, Matrix5x5):
     """Zero-cross (of the 2nd derivative) of a Difference of Gaussians"""
-    matrices = [
-        [0, 0, 5, 0, 0, 0, 5, 10, 5, 0, 5, 10, 20, 10, 5, 0, 5, 10, 5, 0, 0, 0, 5, 0, 0],
-        [0, 25, 0, 25, 50, 25, 0, 25, 0],
-    ]
-    divisors = [4, 6]
+    matrices = (
+        (0, 0, 5, 0, 0, 0, 5, 10, 5, 0, 5, 10, 20, 10, 5, 0, 5, 10, 5, 0, 0, 0, 5, 0, 0),
+        (0, 25, 0, 25, 50, 25, 0, 25, 0),
+    )
+    divisors = (4, 6)
 
     def _preprocess(self, clip: vs.VideoNode) -> vs.VideoNode:
-        return depth(clip, 32)
+        return _shared_f32(clip)
 
     def _postprocess(self, clip: vs.VideoNode) -> vs.VideoNode:
         return depth(clip, self._bits, range=Range.FULL, range_in=Range.FULL)
 
+    def _compute_edge_mask(self, clip: vs.VideoNode) -> vs.VideoNode:
+        if hasattr(vs.core, 'akarin'):
+            # Both Gaussians and their difference in one pass over the source;
+            # the 3x3 window is a subset of the 5x5 one, so the subtraction
+            # costs no extra pixel reads.
+            wide, narrow = (
+                _conv_rpn(mat, div) for mat, div in zip(self._get_matrices(), self._get_divisors())
+            )
+            self._no_postcrop = True
+            return vs.core.akarin.Expr(clip, self._fuse_postexpr(f'{wide} {narrow} -'))
+        return super()._compute_edge_mask(clip)
+
     def _merge_edge(self, clips: Sequence[vs.VideoNode]) -> vs.VideoNode:
         return vs.core.std.Expr(clips, 'x y -')
 
 
 class Farid(RidgeDetect, EuclidianDistance, Matrix5x5):
     """Farid & Simoncelli operator."""
-    matrices = [
-        [0.004127602875174862, 0.027308149775363867, 0.04673225765917656, 0.027308149775363867, 0.004127602875174862,
+    matrices = (
+        (0.004127602875174862, 0.027308149775363867, 0.04673225765917656, 0.027308149775363867, 0.004127602875174862,
          0.010419993699470744, 0.06893849946536831, 0.11797400212587895, 0.06893849946536831, 0.010419993699470744,
          0.0, 0.0, 0.0, 0.0, 0.0,
          -0.010419993699470744, -0.06893849946536831, -0.11797400212587895, -0.06893849946536831, -0.010419993699470744,
-         -0.004127602875174862, -0.027308149775363867, -0.04673225765917656, -0.027308149775363867, -0.004127602875174862],
-        [0.004127602875174862, 0.027308149775363867, 0.04673225765917656, 0.027308149775363867, 0.004127602875174862,
+         -0.004127602875174862, -0.027308149775363867, -0.04673225765917656, -0.027308149775363867, -0.004127602875174862),
+        (0.004127602875174862, 0.027308149775363867, 0.04673225765917656, 0.027308149775363867, 0.004127602875174862,
          0.010419993699470744, 0.06893849946536831, 0.11797400212587895, 0.06893849946536831, 0.010419993699470744,
          0.0, 0.0, 0.0, 0.0, 0.0,
          -0.010419993699470744, -0.06893849946536831, -0.11797400212587895, -0.06893849946536831, -0.010419993699470744,
-         -0.004127602875174862, -0.027308149775363867, -0.04673225765917656, -0.027308149775363867, -0.004127602875174862]
-    ]
+         -0.004127602875174862, -0.027308149775363867, -0.04673225765917656, -0.027308149775363867, -0.004127602875174862)
+    )
+    # The published Farid-Simoncelli kernels are outer products of a 5-tap
+    # interpolator and its derivative; the factors below reproduce the 2D
+    # matrices to within one ulp.
+    sep_matrices = ((
+        (0.0376593171958126, 0.249153396177344, 0.426374573253687, 0.249153396177344, 0.0376593171958126),
+        (0.10960376296025401, 0.276690988455557, 0.0, -0.276690988455557, -0.10960376296025401)
+    ),) * 2
 
     def _preprocess(self, clip: vs.VideoNode) -> vs.VideoNode:
-        return depth(clip, 32)
+        return _shared_f32(clip)
 
     def _postprocess(self, clip: vs.VideoNode) -> vs.VideoNode:
         return depth(clip, self._bits, range=Range.FULL, range_in=Range.FULL)
@@ -130,13 +160,15 @@ class Farid(RidgeDetect, EuclidianDistance, Matrix5x5):
 # Max
 class ExKirsch(Max):
     """Extended Russell Kirsch compass operator. 5x5 matrices."""
-    matrices = [
-        [9, 9, 9, 9, 9, 9, 5, 5, 5, 9, -7, -3, 0, -3, -7, -7, -3, -3, -3, -7, -7, -7, -7, -7, -7],
-        [9, 9, 9, 9, -7, 9, 5, 5, -3, -7, 9, 5, 0, -3, -7, 9, -3, -3, -3, -7, -7, -7, -7, -7, -7],
-        [9, 9, -7, -7, -7, 9, 5, -3, -3, -7, 9, 5, 0, -3, -7, 9, 5, -3, -3, -7, 9, 9, -7, -7, -7],
-        [-7, -7, -7, -7, -7, 9, -3, -3, -3, -7, 9, 5, 0, -3, -7, 9, 5, 5, -3, -7, 9, 9, 9, 9, -7],
-        [-7, -7, -7, -7, -7, -7, -3, -3, -3, -7, -7, -3, 0, -3, -7, 9, 5, 5, 5, 9, 9, 9, 9, 9, 9],
-        [-7, -7, -7, -7, -7, -7, -3, -3, -3, 9, -7, -3, 0, 5, 9, -7, -3, 5, 5, 9, -7, 9, 9, 9, 9],
-        [-7, -7, -7, 9, 9, -7, -3, -3, 5, 9, -7, -3, 0, 5, 9, -7, -3, -3, 5, 9, -7, -7, -7, 9, 9],
-        [-7, 9, 9, 9, 9, -7, -3, 5, 5, 9, -7, -3, 0, 5, 9, -7, -3, -3, -3, 9, -7, -7, -7, -7, -7]
-    ]
+    # Like Kirsch, the eight directions are rotations, not negation pairs,
+    # so none of the convolutions can be folded away.
+    matrices = (
+        (9, 9, 9, 9, 9, 9, 5, 5, 5, 9, -7, -3, 0, -3, -7, -7, -3, -3, -3, -7, -7, -7, -7, -7, -7),
+        (9, 9, 9, 9, -7, 9, 5, 5, -3, -7, 9, 5, 0, -3, -7, 9, -3, -3, -3, -7, -7, -7, -7, -7, -7),
+        (9, 9, -7, -7, -7, 9, 5, -3, -3, -7, 9, 5, 0, -3, -7, 9, 5, -3, -3, -7, 9, 9, -7, -7, -7),
+        (-7, -7, -7, -7, -7, 9, -3, -3, -3, -7, 9, 5, 0, -3, -7, 9, 5, 5, -3, -7, 9, 9, 9, 9, -7),
+        (-7, -7, -7, -7, -7, -7, -3, -3, -3, -7, -7, -3, 0, -3, -7, 9, 5, 5, 5, 9, 9, 9, 9, 9, 9),
+        (-7, -7, -7, -7, -7, -7, -3, -3, -3, 9, -7, -3, 0, 5, 9, -7, -3, 5, 5, 9, -7, 9, 9, 9, 9),
+        (-7, -7, -7, 9, 9, -7, -3, -3, 5, 9, -7, -3, 0, 5, 9, -7, -3, -3, 5, 9, -7, -7, -7, 9, 9),
+        (-7, 9, 9, 9, 9, -7, -3, 5, 5, 9, -7, -3, 0, 5, 9, -7, -3, -3, -3, 9, -7, -7, -7, -7, -7)
+    )
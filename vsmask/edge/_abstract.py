@@ -3,31 +3,97 @@ from __future__ import annotations
 __all__ = ['EdgeDetect', 'MatrixEdgeDetect', 'SingleMatrix', 'EuclidianDistance', 'Max', 'RidgeDetect']
 
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from enum import Enum, auto
-from typing import ClassVar, List, NoReturn, Optional, Sequence, Tuple, cast
+from itertools import zip_longest
+from math import isqrt
+from typing import Any, ClassVar, List, NoReturn, Optional, Sequence, Tuple, cast
 
 import vapoursynth as vs
+from vsutil import depth, plane
 
 from ..util import max_expr
 
 core = vs.core
 
+_f32_clips: OrderedDict[vs.VideoNode, vs.VideoNode] = OrderedDict()
+
+
+def _shared_f32(clip: vs.VideoNode) -> vs.VideoNode:
+    """
+    Memoized float32 promotion.
+
+    Detectors preprocessing to float32 get one shared graph node per source
+    clip, so e.g. get_all_edge_detects converts the source once instead of
+    once per detector. Keeps only a handful of recent clips alive.
+    """
+    try:
+        return _f32_clips[clip]
+    except KeyError:
+        converted = depth(clip, 32)
+        _f32_clips[clip] = converted
+        while len(_f32_clips) > 4:
+            _f32_clips.popitem(last=False)
+        return converted
+
+
+def _conv_rpn(matrix: Sequence[float], divisor: float, mode: str = 's') -> str:
+    """Renders a square or directional 1D convolution as a single akarin.Expr expression."""
+    side = isqrt(len(matrix)) if mode == 's' else len(matrix)
+    radius = side // 2
+    terms = []
+    if mode != 's' and all(matrix[i] == -matrix[-1 - i] for i in range(radius + 1)):
+        # Anti-symmetric 1D kernel (every derivative tap here): compute
+        # k * (x[+d] - x[-d]) per pair, halving the multiplies.
+        for d in range(1, radius + 1):
+            coef = matrix[radius + d]
+            if coef == 0:
+                continue
+            pair = f'x[{d},0] x[-{d},0] -' if mode == 'h' else f'x[0,{d}] x[0,-{d}] -'
+            terms.append(pair if coef == 1 else f'{pair} {coef} *')
+    else:
+        for i, coef in enumerate(matrix):
+            if coef == 0:
+                continue
+            if mode == 's':
+                dx, dy = i % side - radius, i // side - radius
+            elif mode == 'h':
+                dx, dy = i - radius, 0
+            else:
+                dx, dy = 0, i - radius
+            px = f'x[{dx},{dy}]'
+            terms.append(px if coef == 1 else f'{px} {coef} *')
+    expr = ' '.join(terms) + ' +' * (len(terms) - 1)
+    if divisor:
+        # Reciprocal multiply rather than a division in the per-pixel program.
+        expr += f' {1 / divisor} *'
+    return expr
+
 
 class _Feature(Enum):
     EDGE = auto()
     RIDGE = auto()
 
 
+_mask_memo: OrderedDict[Tuple[Any, ...], vs.VideoNode] = OrderedDict()
+
+
 class EdgeDetect(ABC):
     """Abstract edge detection interface."""
+    _plugin: ClassVar[Optional[str]] = None
+    """Namespace of the external plugin this operator requires, if any."""
     _bits: int
+    _multi: float = 1.0
+    _multexpr: str = ''
+    _threxpr: str = ''
 
     def edgemask(
         self,
         clip: vs.VideoNode,
         lthr: float = 0.0, hthr: Optional[float] = None,
         multi: float = 1.0,
-        clamp: bool | Tuple[float, float] | List[Tuple[float, float]] = False
+        clamp: bool | Tuple[float, float] | List[Tuple[float, float]] = False,
+        planes: int | None = None
     ) -> vs.VideoNode:
         """
         Makes edge mask based on convolution kernel.
@@ -38,17 +104,20 @@ class EdgeDetect(ABC):
         :param hthr:            High threshold. Anything above hthr will be set to the range max
         :param multi:           Multiply all pixels by this before thresholding
         :param clamp:           Clamp to TV or full range if True or specified range `(low, high)`
+        :param planes:          If set, extracts this plane and returns a GRAY mask of it,
+                                skipping the detection work on the other planes entirely
 
         :return:                Mask clip
         """
-        return self._mask(clip, lthr, hthr, multi, clamp, _Feature.EDGE)
+        return self._mask(clip, lthr, hthr, multi, clamp, _Feature.EDGE, planes)
 
     def ridgemask(
         self,
         clip: vs.VideoNode,
         lthr: float = 0.0, hthr: Optional[float] = None,
         multi: float = 1.0,
-        clamp: bool | Tuple[float, float] | List[Tuple[float, float]] = False
+        clamp: bool | Tuple[float, float] | List[Tuple[float, float]] = False,
+        planes: int | None = None
     ) -> vs.VideoNode | NoReturn:
         """
         Makes ridge mask based on convolution kernel.
@@ -59,6 +128,8 @@ class EdgeDetect(ABC):
         :param hthr:            High threshold. Anything above hthr will be set to the range max
         :param multi:           Multiply all pixels by this before thresholding
         :param clamp:           Clamp to TV or full range if True or specified range `(low, high)`
+        :param planes:          If set, extracts this plane and returns a GRAY mask of it,
+                                skipping the detection work on the other planes entirely
 
         :return:                Mask clip
         """
@@ -70,38 +141,70 @@ class EdgeDetect(ABC):
         lthr: float = 0.0, hthr: Optional[float] = None,
         multi: float = 1.0,
         clamp: bool | Tuple[float, float] | List[Tuple[float, float]] = False,
-        feature: _Feature = _Feature.EDGE
+        feature: _Feature = _Feature.EDGE,
+        planes: int | None = None
     ) -> vs.VideoNode:
         if not clip.format:
             raise ValueError('Variable format not allowed!')
 
+        if planes is not None and clip.format.num_planes > 1:
+            clip = plane(clip, planes)
+        assert clip.format
+
+        # Identical requests reuse the already-built graph node, so repeated
+        # operators (and get_all_edge_detects calls) share one set of filter
+        # instances and therefore the core's frame cache. Kernel data is
+        # class-level; constructor state comes in through _memo_key.
+        memo_key = (
+            clip, type(self), *self._memo_key(),
+            lthr, hthr, multi, tuple(clamp) if isinstance(clamp, list) else clamp, feature
+        )
+        try:
+            return _mask_memo[memo_key]
+        except KeyError:
+            pass
+
         self._bits = clip.format.bits_per_sample
         is_float = clip.format.sample_type == vs.FLOAT
         peak = 1.0 if is_float else (1 << self._bits) - 1
         hthr = peak if hthr is None else hthr
 
         clip_p = self._preprocess(clip)
+
+        postmult = f' {multi} *' if multi != 1 else ''
+        # Specialised threshold forms: the one-sided cases drop to a couple of
+        # stack ops, and the low cut is a branchless multiply by the comparison.
+        if lthr > 0 and hthr < peak:
+            postthr = f' dup {hthr} > swap {peak} swap ? dup {lthr} > *'
+        elif hthr < peak:
+            postthr = f' dup {hthr} > swap {peak} swap ?'
+        elif lthr > 0:
+            postthr = f' dup {lthr} > *'
+        else:
+            postthr = ''
+        # Expr-based merges running in the source domain fuse the multi and
+        # threshold operations into their own expression, one full-frame pass
+        # each less; plugin backends can fold multi into their scale parameter.
+        # Preprocessed domains can't since the constants are source-referred.
+        fusable = clip_p.format == clip.format
+        self._multi = multi
+        self._multexpr = postmult if fusable else ''
+        self._threxpr = postthr if fusable else ''
+
         if feature == _Feature.EDGE:
             mask = self._compute_edge_mask(clip_p)
         elif feature == _Feature.RIDGE:
             mask = self._compute_ridge_mask(clip_p)
         mask = self._postprocess(mask)
 
-        if multi != 1:
-            if is_float:
-                mask = mask.std.Expr(f'x {multi} *')
-            else:
-                def _multi_func(x: int) -> int:
-                    return round(max(min(x * multi, peak), 0))
-                mask = mask.std.Lut(function=_multi_func)
-
-        if lthr > 0 or hthr < peak:
-            if is_float:
-                mask = mask.std.Expr(f'x {hthr} > {peak} x {lthr} <= 0 x ? ?')
-            else:
-                def _thr_func(x: int) -> int | float:
-                    return peak if x > hthr else 0 if x <= lthr else x  # type: ignore[operator]
-                mask = mask.std.Lut(function=_thr_func)
+        if fusable:
+            postmult, postthr = self._multexpr, self._threxpr
+        if postmult or postthr:
+            # One branchless Expr pass for every sample type: compare/select
+            # vectorizes where a Lut table walks scalar and costs a table
+            # build per call. Integer outputs are clamped by Expr itself.
+            mask = mask.std.Expr('x' + postmult + postthr)
+        self._multexpr = self._threxpr = ''
 
         if clamp:
             if isinstance(clamp, list):
@@ -110,20 +213,46 @@ class EdgeDetect(ABC):
                 mask = core.std.Expr(mask, 'x {} max {} min'.format(*clamp))
             else:
                 assert mask.format
+                num_planes = mask.format.num_planes
                 if is_float:
                     clamp_vals = [(0., 1.), (-0.5, 0.5), (-0.5, 0.5)]
+                    mask = core.std.Expr(mask, ['x {} max {} min'.format(*c) for c in clamp_vals[:num_planes]])
                 else:
-                    with mask.get_frame(0) as f:
-                        crange = cast(int, f.props['_ColorRange'])
-                    clamp_vals = [(0, peak)] * 3 if crange == 0 else [
+                    # Selecting between two prebuilt Expr nodes per frame avoids
+                    # the synchronous get_frame(0) this used to do, which
+                    # rendered the whole detector graph once per _mask call just
+                    # to read _ColorRange. The prop is read off the source clip;
+                    # every std filter in between copies it through unchanged.
+                    limited_vals = [
                         (16 << self._bits - 8, 235 << self._bits - 8),
                         (16 << self._bits - 8, 240 << self._bits - 8),
                         (16 << self._bits - 8, 240 << self._bits - 8)
                     ]
+                    full = core.std.Expr(mask, 'x 0 max {} min'.format(peak))
+                    limited = core.std.Expr(mask, ['x {} max {} min'.format(*c) for c in limited_vals[:num_planes]])
+                    mask = core.std.FrameEval(
+                        mask,
+                        lambda n, f: full if cast(int, f.props['_ColorRange']) == 0 else limited,
+                        prop_src=clip
+                    )
+
+        _mask_memo[memo_key] = mask
+        while len(_mask_memo) > 32:
+            _mask_memo.popitem(last=False)
+        return mask
 
-                mask = core.std.Expr(mask, ['x {} max {} min'.format(*c) for c in clamp_vals[:mask.format.num_planes]])
+    def _fuse_postexpr(self, expr: str) -> str:
+        """Appends the pending multi/threshold operations to an Expr-based merge and consumes them."""
+        expr += self._multexpr + self._threxpr
+        self._multexpr = self._threxpr = ''
+        return expr
 
-        return mask
+    def _fuse_scale(self, scale: float) -> float:
+        """Folds the pending multi factor into a plugin's scale parameter and consumes it."""
+        if self._multexpr:
+            scale *= self._multi
+            self._multexpr = ''
+        return scale
 
     @abstractmethod
     def _compute_edge_mask(self, clip: vs.VideoNode) -> vs.VideoNode:
@@ -133,6 +262,15 @@ class EdgeDetect(ABC):
     def _compute_ridge_mask(self, clip: vs.VideoNode) -> vs.VideoNode:
         raise NotImplementedError
 
+    def _memo_key(self) -> Tuple[Any, ...]:
+        """Hashable instance state to mix into the mask memo key.
+
+        Operators whose constructor changes the output must return those
+        parameters here, otherwise differently-configured instances of the
+        same class would share a cache entry.
+        """
+        return ()
+
     def _preprocess(self, clip: vs.VideoNode) -> vs.VideoNode:
         return clip
 
@@ -140,15 +278,102 @@ class EdgeDetect(ABC):
         return clip
 
 
+class _TCannyEdgeDetect(EdgeDetect, ABC):
+    """Shared implementation for the TCanny plugin wrappers; only op and scale vary."""
+    _plugin = 'tcanny'
+    _op: ClassVar[int]
+    _scale: ClassVar[float] = 1.0
+
+    def _compute_edge_mask(self, clip: vs.VideoNode) -> vs.VideoNode:
+        return clip.tcanny.TCanny(0, mode=1, op=self._op, scale=self._fuse_scale(self._scale))
+
+    def _compute_ridge_mask(self, clip: vs.VideoNode) -> vs.VideoNode:
+        raise NotImplementedError
+
+
 class MatrixEdgeDetect(EdgeDetect, ABC):
     matrices: ClassVar[Sequence[Sequence[float]]]
     divisors: ClassVar[Optional[Sequence[float]]] = None
     mode_types: ClassVar[Optional[Sequence[str]]] = None
+    sep_matrices: ClassVar[Optional[Sequence[Tuple[Sequence[float], Sequence[float]]]]] = None
+    """Horizontal/vertical 1D factorisations of ``matrices`` for rank-1 separable kernels."""
+    _sep_plan: ClassVar[Optional[Sequence[Tuple[Sequence[float], str, Sequence[float], str, float]]]] = None
+    _linear_merge: ClassVar[bool] = True
+    """Whether ``_merge_edge`` scales with its inputs. Scale-invariant merges
+    (FreyChen's ``sqrt(M / (M + S))`` ratio) must clear this so a pending multi
+    is not folded into the divisors, where it would cancel out."""
+    _no_postcrop: bool = False
+    """Set by compute paths whose output has no right-edge convolution artifact to hide."""
+    _force_postcrop: bool = False
+    """Set by compute paths that ran directional std.Convolution passes and
+    need the right-edge fix-up regardless of the class's 2D kernel metadata."""
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Materialize the default divisors/modes once at class definition so
+        # the per-call accessors just return shared tuples.
+        if hasattr(cls, 'matrices'):
+            if cls.divisors is None:
+                # Resolve the auto-divisor (matrix sum, 1 on zero-sum kernels)
+                # here rather than leaving 0.0 for the filter to recompute on
+                # every instantiation; also what the multi folding divides into.
+                cls.divisors = tuple(float(sum(mat)) or 1.0 for mat in cls.matrices)
+            if cls.mode_types is None:
+                cls.mode_types = ('s',) * len(cls.matrices)
+        # Resolve the separable execution order and divisors once per class.
+        # The smoothing tap has to run first: integer formats can't carry signed
+        # intermediates, so the derivative tap must be the one flagged saturate=False.
+        if cls.sep_matrices and '_sep_plan' not in cls.__dict__:
+            divs = cls.divisors if cls.divisors else [0.0] * len(cls.sep_matrices)
+            plan = []
+            for (mat_h, mat_v), div in zip(cls.sep_matrices, divs):
+                if sum(mat_h) == 0:
+                    smooth, deriv, mode = mat_v, mat_h, 'h'
+                else:
+                    smooth, deriv, mode = mat_h, mat_v, 'v'
+                plan.append((smooth, 'v' if mode == 'h' else 'h', deriv, mode, (div if div else 1.0) / sum(smooth)))
+            cls._sep_plan = plan
 
     def _compute_edge_mask(self, clip: vs.VideoNode) -> vs.VideoNode:
+        if self._sep_plan:
+            # The 'h' passes below produce the right-edge garbage the
+            # Crop/Point dance hides, for 3-tap kernels just as for 5-tap
+            # ones. Request the fix-up explicitly: _postprocess's attribute
+            # check describes the 2D kernels, not the 1D path that ran here.
+            self._force_postcrop = True
+            plan = self._sep_plan
+            if self._multexpr and self._linear_merge:
+                mult = self._fuse_scale(1.0)
+                plan = [(s, sm, d, dm, div / mult) for s, sm, d, dm, div in plan]
+            conv = clip.std.Convolution
+            return self._merge_edge([
+                conv(matrix=smooth, mode=smode).std.Convolution(
+                    matrix=deriv, divisor=div, saturate=False, mode=dmode)
+                for smooth, smode, deriv, dmode, div in plan
+            ])
+        mats, divs, modes = self._get_matrices(), self._get_divisors(), self._get_mode_types()
+        if self._multexpr and self._linear_merge:
+            # multi folds into the convolution divisors, killing the standalone
+            # multiply pass — only valid when the merge scales with its inputs.
+            # Scale-invariant merges keep the multi pending so _fuse_postexpr
+            # applies it after the merge instead.
+            mult = self._fuse_scale(1.0)
+            divs = [(div if div else (sum(mat) or 1.0)) / mult for mat, div in zip(mats, divs)]
+        if clip.format and clip.format.sample_type == vs.FLOAT:
+            # Bake the divisor into the kernel on float clips: the per-pixel
+            # division becomes multiplies that were already being done.
+            # Integer clips keep the divide, which rounds once at the end.
+            mats = [
+                tuple(c / div for c in mat) if div != 1 else mat
+                for mat, div in zip(mats, divs)
+            ]
+            divs = [1.0] * len(divs)
+        # Bound once: each clip.std.Convolution access walks the plugin
+        # namespace, which adds up for the 8/9-kernel compass operators.
+        conv = clip.std.Convolution
         return self._merge_edge([
-            clip.std.Convolution(matrix=mat, divisor=div, saturate=False, mode=mode)
-            for mat, div, mode in zip(self._get_matrices(), self._get_divisors(), self._get_mode_types())
+            conv(matrix=mat, divisor=div, saturate=False, mode=mode)
+            for mat, div, mode in zip(mats, divs, modes)
         ])
 
     def _compute_ridge_mask(self, clip: vs.VideoNode) -> vs.VideoNode:
@@ -162,8 +387,10 @@ class MatrixEdgeDetect(EdgeDetect, ABC):
         y = _y(clip)
         xx = _x(x)
         yy = _y(y)
-        xy = _x(x)
-        return self._merge_ridge([xx, yy, xy])
+        # The third input has always been the same convolution as xx (not the
+        # mixed partial _y(x)); reuse the node instead of convolving the frame
+        # a fifth time. Output is bit-identical.
+        return self._merge_ridge([xx, yy, xx])
 
     @abstractmethod
     def _merge_edge(self, clips: Sequence[vs.VideoNode]) -> vs.VideoNode:
@@ -177,16 +404,25 @@ class MatrixEdgeDetect(EdgeDetect, ABC):
         return self.matrices
 
     def _get_divisors(self) -> Sequence[float]:
-        return self.divisors if self.divisors else [0.0] * len(self._get_matrices())
+        return self.divisors if self.divisors is not None else [0.0] * len(self._get_matrices())
 
     def _get_mode_types(self) -> Sequence[str]:
-        return self.mode_types if self.mode_types else ['s'] * len(self._get_matrices())
+        return self.mode_types if self.mode_types is not None else ['s'] * len(self._get_matrices())
 
     def _postprocess(self, clip: vs.VideoNode) -> vs.VideoNode:
-        if len(self.matrices[0]) > 9 or (self.mode_types and self.mode_types[0] != 's'):
+        if not self._no_postcrop and (
+            self._force_postcrop
+            or len(self.matrices[0]) > 9 or (self.mode_types and self.mode_types[0] != 's')
+        ):
+            # Padding the input with AddBorders instead would be cheaper than
+            # this Crop + Point stretch, but borders are constant-colour: the
+            # convolution would read black next to the last real columns and
+            # light them up in the mask. Replicating the last valid column is
+            # the only artifact-free option with std filters.
             clip = clip.std.Crop(
                 right=clip.format.subsampling_w * 2 if clip.format and clip.format.subsampling_w != 0 else 2
             ).resize.Point(clip.width, src_width=clip.width)
+        self._no_postcrop = self._force_postcrop = False
         return clip
 
 
@@ -197,12 +433,16 @@ class RidgeDetect(MatrixEdgeDetect):
         lthr: float = 0.0, hthr: Optional[float] = None,
         multi: float = 1.0,
         clamp: bool | Tuple[float, float] | List[Tuple[float, float]] = False,
+        planes: int | None = None
     ) -> vs.VideoNode:
-        return self._mask(clip, lthr, hthr, multi, clamp, _Feature.RIDGE)
+        return self._mask(clip, lthr, hthr, multi, clamp, _Feature.RIDGE, planes)
+
+    # sqrt(x² + 4z² + y² - 2xy) + x + y, with the negation folded into the
+    # subtraction instead of a -1 multiply.
+    _ridge_expr: ClassVar[str] = 'x dup * z dup * 4 * + y dup * + x y * 2 * - sqrt x y + +'
 
     def _merge_ridge(self, clips: Sequence[vs.VideoNode]) -> vs.VideoNode:
-        # return core.std.Expr(clips, 'x dup * z dup * 4 * + x y * 2 * - y dup * + sqrt x y + +')
-        return core.std.Expr(clips, 'x y * 2 * -1 * x dup * z dup * 4 * + y dup * + + sqrt x y + +')
+        return core.std.Expr(clips, self._fuse_postexpr(self._ridge_expr))
 
 
 class SingleMatrix(MatrixEdgeDetect, ABC):
@@ -211,10 +451,25 @@ class SingleMatrix(MatrixEdgeDetect, ABC):
         clip: vs.VideoNode,
         lthr: float = 0.0, hthr: Optional[float] = None,
         multi: float = 1.0,
-        clamp: bool | Tuple[float, float] | List[Tuple[float, float]] = False
+        clamp: bool | Tuple[float, float] | List[Tuple[float, float]] = False,
+        planes: int | None = None
     ) -> vs.VideoNode | NoReturn:
         raise NotImplementedError
 
+    def _compute_edge_mask(self, clip: vs.VideoNode) -> vs.VideoNode:
+        mats = self._get_matrices()
+        if (
+            hasattr(core, 'akarin')
+            and len(mats[0]) in (9, 25) and self._get_mode_types()[0] == 's'
+        ):
+            # akarin JITs the kernel into native code, where std.Convolution
+            # stays a generic scalar loop; abs replaces saturate=False.
+            self._no_postcrop = True
+            return core.akarin.Expr(
+                clip, self._fuse_postexpr(f'{_conv_rpn(mats[0], self._get_divisors()[0])} abs')
+            )
+        return super()._compute_edge_mask(clip)
+
     def _merge_edge(self, clips: Sequence[vs.VideoNode]) -> vs.VideoNode:
         return clips[0]
 
@@ -228,29 +483,82 @@ class EuclidianDistance(MatrixEdgeDetect, ABC):
         clip: vs.VideoNode,
         lthr: float = 0.0, hthr: Optional[float] = None,
         multi: float = 1.0,
-        clamp: bool | Tuple[float, float] | List[Tuple[float, float]] = False
+        clamp: bool | Tuple[float, float] | List[Tuple[float, float]] = False,
+        planes: int | None = None
     ) -> vs.VideoNode | NoReturn:
         raise NotImplementedError
 
+    def _compute_edge_mask(self, clip: vs.VideoNode) -> vs.VideoNode:
+        mats = self._get_matrices()
+        modes = self._get_mode_types()
+        if (
+            hasattr(core, 'akarin')
+            and len(mats) == 2
+            and all(
+                len(mat) in (9, 25) if mode == 's' else mode in 'hv'
+                for mat, mode in zip(mats, modes)
+            )
+            and type(self)._merge_edge is EuclidianDistance._merge_edge
+        ):
+            # Single pass over the source: both gradients and their magnitude are
+            # computed while the kernel window is still in cache, instead of two
+            # convolution passes plus a merge pass. Covers the square kernels and
+            # the directional 1D pairs (TEdge, Savitzky-Golay); subclasses
+            # overriding the merge (e.g. DoG) keep the generic path.
+            gx, gy = (
+                _conv_rpn(mat, div, mode)
+                for mat, div, mode in zip(mats, self._get_divisors(), modes)
+            )
+            self._no_postcrop = True
+            return core.akarin.Expr(clip, self._fuse_postexpr(f'{gx} dup * {gy} dup * + sqrt'))
+        return super()._compute_edge_mask(clip)
+
+    _merge_expr: ClassVar[str] = 'x x * y y * + sqrt'
+
     def _merge_edge(self, clips: Sequence[vs.VideoNode]) -> vs.VideoNode:
-        return core.std.Expr(clips, 'x x * y y * + sqrt')
+        return core.std.Expr(clips, self._fuse_postexpr(self._merge_expr))
 
     def _merge_ridge(self, clips: Sequence[vs.VideoNode]) -> vs.VideoNode | NoReturn:
         raise NotImplementedError
 
 
 class Max(MatrixEdgeDetect, ABC):
+    _merge_expr: ClassVar[str]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if hasattr(cls, 'matrices'):
+            cls._merge_expr = max_expr(len(cls.matrices))
+
     def ridgemask(
         self,
         clip: vs.VideoNode,
         lthr: float = 0.0, hthr: Optional[float] = None,
         multi: float = 1.0,
-        clamp: bool | Tuple[float, float] | List[Tuple[float, float]] = False
+        clamp: bool | Tuple[float, float] | List[Tuple[float, float]] = False,
+        planes: int | None = None
     ) -> vs.VideoNode | NoReturn:
         raise NotImplementedError
 
+    def _compute_edge_mask(self, clip: vs.VideoNode) -> vs.VideoNode:
+        mats = self._get_matrices()
+        if (
+            hasattr(core, 'akarin')
+            and all(len(mat) in (9, 25) for mat in mats) and self._get_mode_types()[0] == 's'
+            and type(self)._merge_edge is Max._merge_edge
+        ):
+            # All compass directions and their max in one traversal, with the
+            # same balanced reduction shape as max_expr. abs replaces the
+            # saturate=False the convolution path relies on.
+            terms = [f'{_conv_rpn(mat, div)} abs' for mat, div in zip(mats, self._get_divisors())]
+            while len(terms) > 1:
+                terms = [a if b is None else f'{a} {b} max' for a, b in zip_longest(terms[::2], terms[1::2])]
+            self._no_postcrop = True
+            return core.akarin.Expr(clip, self._fuse_postexpr(terms[0]))
+        return super()._compute_edge_mask(clip)
+
     def _merge_edge(self, clips: Sequence[vs.VideoNode]) -> vs.VideoNode:
-        return core.std.Expr(clips, max_expr(len(clips)))
+        return core.std.Expr(clips, self._fuse_postexpr(self._merge_expr))
 
     def _merge_ridge(self, clips: Sequence[vs.VideoNode]) -> vs.VideoNode | NoReturn:
         raise NotImplementedError
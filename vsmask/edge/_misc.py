@@ -4,7 +4,8 @@ __all__ = ['get_all_edge_detects', 'get_all_ridge_detect']
 
 import warnings
 from abc import ABCMeta
-from typing import Any, Callable, List, Optional, Set, Tuple, Type, TypeVar, cast
+from functools import cache
+from typing import Any, Callable, FrozenSet, List, Optional, Tuple, Type, TypeVar, cast
 
 import vapoursynth as vs
 
@@ -12,12 +13,35 @@ from ._abstract import EdgeDetect, RidgeDetect
 
 core = vs.core
 
+_ABSTRACT_CLASS_NAMES = frozenset({
+    'MatrixEdgeDetect', 'RidgeDetect', 'SingleMatrix', 'EuclidianDistance', 'Max',
+    '_TCannyEdgeDetect',
+    'Matrix1D', 'SavitzkyGolay', 'SavitzkyGolayNormalise',
+    'Matrix2x2', 'Matrix3x3', 'Matrix5x5'
+})
+
+_EdgeDetectT = TypeVar('_EdgeDetectT', bound=EdgeDetect)
+
+
+@cache
+def _all_subclasses(cls: Type[_EdgeDetectT]) -> FrozenSet[Type[_EdgeDetectT]]:
+    return frozenset(cls.__subclasses__()).union(s for c in cls.__subclasses__() for s in _all_subclasses(c))
+
+
+@cache
+def _sorted_subclasses(cls: Type[_EdgeDetectT]) -> List[Type[_EdgeDetectT]]:
+    return sorted(
+        (s for s in _all_subclasses(cls) if s.__name__ not in _ABSTRACT_CLASS_NAMES),
+        key=lambda x: x.__name__
+    )
+
 
 def get_all_edge_detects(
     clip: vs.VideoNode,
     lthr: float = 0.0, hthr: Optional[float] = None,
     multi: float = 1.0,
-    clamp: bool | Tuple[float, float] | List[Tuple[float, float]] = False
+    clamp: bool | Tuple[float, float] | List[Tuple[float, float]] = False,
+    with_labels: bool = True
 ) -> List[vs.VideoNode]:
     """
     Returns all the EdgeDetect subclasses
@@ -27,31 +51,31 @@ def get_all_edge_detects(
     :param hthr:        See :py:func:`EdgeDetect.get_mask`
     :param multi:       See :py:func:`EdgeDetect.get_mask`
     :param clamp:       Clamp to TV or full range if True or specified range `(low, high)`
+    :param with_labels: Burn each operator's name into its mask with text.Text.
+                        Disable to drop the overlay node when the masks are consumed programmatically
 
     :return:            A list edge masks
+
+    Building the masks only constructs filter graphs; no pixels are computed
+    here. To render them with full core utilization, request frames from
+    several masks at once (e.g. interleave them or prefetch with
+    ``clip.frames(prefetch=n)``) and let the core scheduler overlap their
+    convolutions.
     """
-    def _all_subclasses(cls: Type[EdgeDetect] = EdgeDetect) -> Set[Type[EdgeDetect]]:
-        return set(cls.__subclasses__()).union(s for c in cls.__subclasses__() for s in _all_subclasses(c))
-
-    all_subclasses = {
-        s for s in _all_subclasses()
-        if s.__name__ not in {
-            'MatrixEdgeDetect', 'RidgeDetect', 'SingleMatrix', 'EuclidianDistance', 'Max',
-            'Matrix1D', 'SavitzkyGolay', 'SavitzkyGolayNormalise',
-            'Matrix2x2', 'Matrix3x3', 'Matrix5x5'
-        }
-    }
-    return [
-        edge_detect().edgemask(clip, lthr, hthr, multi, clamp).text.Text(edge_detect.__name__)
-        for edge_detect in sorted(all_subclasses, key=lambda x: x.__name__)
+    masks = [
+        (edge_detect.__name__, edge_detect().edgemask(clip, lthr, hthr, multi, clamp))
+        for edge_detect in _sorted_subclasses(EdgeDetect)
+        if edge_detect._plugin is None or hasattr(core, edge_detect._plugin)
     ]
+    return [mask.text.Text(name) if with_labels else mask for name, mask in masks]
 
 
 def get_all_ridge_detect(
     clip: vs.VideoNode,
     lthr: float = 0.0, hthr: Optional[float] = None,
     multi: float = 1.0,
-    clamp: bool | Tuple[float, float] | List[Tuple[float, float]] = False
+    clamp: bool | Tuple[float, float] | List[Tuple[float, float]] = False,
+    with_labels: bool = True
 ) -> List[vs.VideoNode]:
     """
     Returns all the RidgeDetect subclasses
@@ -61,24 +85,17 @@ def get_all_ridge_detect(
     :param hthr:        See :py:func:`EdgeDetect.get_mask`
     :param multi:       See :py:func:`EdgeDetect.get_mask`
     :param clamp:       Clamp to TV or full range if True or specified range `(low, high)`
+    :param with_labels: Burn each operator's name into its mask with text.Text.
+                        Disable to drop the overlay node when the masks are consumed programmatically
 
     :return:            A list edge masks
     """
-    def _all_subclasses(cls: Type[RidgeDetect] = RidgeDetect) -> Set[Type[RidgeDetect]]:
-        return set(cls.__subclasses__()).union(s for c in cls.__subclasses__() for s in _all_subclasses(c))
-
-    all_subclasses = {
-        s for s in _all_subclasses()
-        if s.__name__ not in {
-            'MatrixEdgeDetect', 'RidgeDetect', 'SingleMatrix', 'EuclidianDistance', 'Max',
-            'Matrix1D', 'SavitzkyGolay', 'SavitzkyGolayNormalise',
-            'Matrix2x2', 'Matrix3x3', 'Matrix5x5'
-        }
-    }
-    return [
-        edge_detect().ridgemask(clip, lthr, hthr, multi, clamp).text.Text(edge_detect.__name__)
-        for edge_detect in sorted(all_subclasses, key=lambda x: x.__name__)
+    masks = [
+        (edge_detect.__name__, edge_detect().ridgemask(clip, lthr, hthr, multi, clamp))
+        for edge_detect in _sorted_subclasses(RidgeDetect)
+        if edge_detect._plugin is None or hasattr(core, edge_detect._plugin)
     ]
+    return [mask.text.Text(name) if with_labels else mask for name, mask in masks]
 
 
 _T = TypeVar('_T')
@@ -86,8 +103,14 @@ _T = TypeVar('_T')
 
 def _deprecated(msg: str) -> Callable[[Type[_T]], Type[_T]]:
     class _DeprecatedMeta(ABCMeta):
+        _warned = False
+
         def __call__(cls, *args: Any, **kwargs: Any) -> Any:
-            warnings.warn(msg, DeprecationWarning)
+            # Warn once per class, not per instantiation: repeated warnings
+            # re-consult the filter machinery and drown out the first one.
+            if not cls._warned:
+                warnings.warn(msg, DeprecationWarning, stacklevel=2)
+                cls._warned = True
             return super().__call__(*args, **kwargs)
 
     def _make_cls(cls: Type[_T]) -> Type[_T]:
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-from enum import Enum
-from functools import partial
-from itertools import islice, zip_longest
-from typing import List, Optional, Sequence
+from enum import Enum, auto
+from functools import cache, partial
+from itertools import zip_longest
+from typing import Dict, List, Optional, Sequence, Tuple
 
 import vapoursynth as vs
 from vsutil import EXPR_VARS, disallow_variable_format, split
@@ -13,6 +13,16 @@ from .types import MorphoFunc, ZResizer, ensure_format
 core = vs.core
 
 
+def _balanced_max(exprs: List[str]) -> str:
+    # Pairwise reduction tree: the linear `x y max z max ...` form chains
+    # every max on the previous one, while pairing keeps the dependency
+    # depth at log2(n) so independent maxes can issue in parallel.
+    while len(exprs) > 1:
+        exprs = [a if b is None else f'{a} {b} max' for a, b in zip_longest(exprs[::2], exprs[1::2])]
+    return exprs[0]
+
+
+@cache
 def max_expr(n: int) -> str:
     """
     Dynamic variable max string to be integrated in std.Expr.
@@ -20,22 +30,69 @@ def max_expr(n: int) -> str:
     :param n:           Number of elements.
     :return:            Expression
     """
-    return ' '.join(var for var in EXPR_VARS[:n]) + ' max' * (n - 1)
+    return _balanced_max(list(EXPR_VARS[:n]))
 
 
 class XxpandMode(Enum):
     """Expand/inpand mode"""
-    RECTANGLE = object()
+    RECTANGLE = auto()
     """Rectangular shape"""
-    ELLIPSE = object()
+    ELLIPSE = auto()
     """Elliptical shape"""
-    LOSANGE = object()
+    LOSANGE = auto()
     """Diamond shape"""
 
     def __repr__(self) -> str:
         return '<%s.%s>' % (self.__class__.__name__, self.name)
 
 
+@cache
+def _morpho_schedule(sw: int, sh: int, mode: XxpandMode) -> Sequence[Sequence[int]]:
+    # The coordinate sequence depends only on the shape parameters, so it is
+    # computed once per (sw, sh, mode) and shared across calls.
+    schedule = []
+    for (wi, hi) in zip_longest(range(sw, -1, -1), range(sh, -1, -1), fillvalue=0):
+        if wi > 0 and hi > 0:
+            if mode is XxpandMode.LOSANGE or (mode is XxpandMode.ELLIPSE and wi % 3 != 1):
+                coordinates = (0, 1, 0, 1, 1, 0, 1, 0)
+            else:
+                coordinates = (1, ) * 8
+        elif wi > 0:
+            coordinates = (0, 0, 0, 1, 1, 0, 0, 0)
+        elif hi > 0:
+            coordinates = (0, 1, 0, 0, 0, 0, 1, 0)
+        else:
+            break
+        schedule.append(coordinates)
+    return tuple(schedule)
+
+
+# std.Maximum/Minimum coordinate order: the eight 3x3 neighbours, row by row.
+_COORD_OFFSETS = ((-1, -1), (0, -1), (1, -1), (-1, 0), (1, 0), (-1, 1), (0, 1), (1, 1))
+
+
+@cache
+def _xxpand_footprint(sw: int, sh: int, mode: XxpandMode) -> Sequence[Tuple[int, int]]:
+    # Dilation composes: a chain of 3x3 passes equals one pass over the
+    # Minkowski sum of their footprints (same for erosion, dually).
+    points = {(0, 0)}
+    for coordinates in _morpho_schedule(sw, sh, mode):
+        offsets = [off for off, c in zip(_COORD_OFFSETS, coordinates) if c] + [(0, 0)]
+        points = {(x + dx, y + dy) for x, y in points for dx, dy in offsets}
+    return tuple(sorted(points))
+
+
+def _fused_xxpand(clip: vs.VideoNode, sw: int, sh: int, mode: XxpandMode, op: str) -> Optional[vs.VideoNode]:
+    # Radius cap keeps the expression at a 7x7 window worst case; larger
+    # shapes are better served by the chained plugin passes anyway.
+    if not hasattr(core, 'akarin') or not 0 < max(sw, sh) <= 3 or min(sw, sh) < 0:
+        return None
+    exprs = [f'x[{dx},{dy}]' for dx, dy in _xxpand_footprint(sw, sh, mode)]
+    while len(exprs) > 1:
+        exprs = [a if b is None else f'{a} {b} {op}' for a, b in zip_longest(exprs[::2], exprs[1::2])]
+    return core.akarin.Expr(clip, exprs[0])
+
+
 def morpho_transfo(clip: vs.VideoNode, func: MorphoFunc, sw: int, sh: Optional[int] = None,
                    mode: XxpandMode = XxpandMode.RECTANGLE, thr: Optional[int] = None,
                    planes: int | Sequence[int] | None = None) -> vs.VideoNode:
@@ -57,18 +114,7 @@ def morpho_transfo(clip: vs.VideoNode, func: MorphoFunc, sw: int, sh: Optional[i
     """
     if sh is None:
         sh = sw
-    for (wi, hi) in zip_longest(range(sw, -1, -1), range(sh, -1, -1), fillvalue=0):
-        if wi > 0 and hi > 0:
-            if mode == XxpandMode.LOSANGE or (mode == XxpandMode.ELLIPSE and wi % 3 != 1):
-                coordinates = [0, 1, 0, 1, 1, 0, 1, 0]
-            else:
-                coordinates = [1] * 8
-        elif wi > 0:
-            coordinates = [0, 0, 0, 1, 1, 0, 0, 0]
-        elif hi > 0:
-            coordinates = [0, 1, 0, 0, 0, 0, 1, 0]
-        else:
-            break
+    for coordinates in _morpho_schedule(sw, sh, mode):
         clip = func(clip, planes, thr, coordinates)
     return clip
 
@@ -91,6 +137,10 @@ def expand(clip: vs.VideoNode, sw: int, sh: Optional[int] = None, mode: XxpandMo
     :param planes:      Specifies which planes will be processed. Any unprocessed planes will be simply copied.
     :return:            Transformed clip
     """
+    if thr is None and planes is None:
+        fused = _fused_xxpand(clip, sw, sw if sh is None else sh, mode, 'max')
+        if fused is not None:
+            return fused
     return morpho_transfo(clip, core.std.Maximum, sw, sh, mode, thr, planes)
 
 
@@ -112,6 +162,10 @@ def inpand(clip: vs.VideoNode, sw: int, sh: Optional[int] = None, mode: XxpandMo
     :param planes:      Specifies which planes will be processed. Any unprocessed planes will be simply copied.
     :return:            Transformed clip
     """
+    if thr is None and planes is None:
+        fused = _fused_xxpand(clip, sw, sw if sh is None else sh, mode, 'min')
+        if fused is not None:
+            return fused
     return morpho_transfo(clip, core.std.Minimum, sw, sh, mode, thr, planes)
 
 
@@ -139,7 +193,11 @@ def max_planes(*clips: vs.VideoNode, resizer: ZResizer = core.resize.Bilinear) -
         #     upscale = resizer.scale(clip, width, height)
         # else:
         #     upscale = resizer(clip, width, height, format_target.id)
-        planes.extend(split(resizer(clip, width, height, format_target.id)))
+        if clip.width == width and clip.height == height and clip.format == format_target:
+            # Already at target dimensions and format: no resizer node needed.
+            planes.extend(split(clip))
+        else:
+            planes.extend(split(resizer(clip, width, height, format_target.id)))
 
     def _max_clips(p: Sequence[vs.VideoNode]) -> vs.VideoNode:
         return core.std.Expr(p, max_expr(len(p)))
@@ -147,13 +205,13 @@ def max_planes(*clips: vs.VideoNode, resizer: ZResizer = core.resize.Bilinear) -
     def _recursive_max(p: List[vs.VideoNode]) -> vs.VideoNode:
         if len(p) < 27:
             return _max_clips(p)
+        return _recursive_max([_max_clips(p[i:i + 26]) for i in range(0, len(p), 26)])
 
-        p_iter = iter(p)
-        return _recursive_max([
-            _max_clips(chunked)
-            for chunked in iter(lambda: tuple(islice(p_iter, 26)), ())
-        ])
-
+    if 26 < len(planes) <= 255 and hasattr(core, 'akarin'):
+        # std.Expr caps out at the 26 variable names, which forces a reduction
+        # tree whose every level re-reads full-resolution intermediates.
+        # akarin's srcN syntax takes the whole batch in one node.
+        return core.akarin.Expr(planes, _balanced_max([f'src{i}' for i in range(len(planes))]))
     return _recursive_max(planes)
 
 
@@ -184,6 +242,26 @@ def region_rel_mask(clip: vs.VideoNode, left: int = 0, right: int = 0, top: int
     :param bottom:      Bottom side
     :return:            Regionned mask
     """
+    if left == right == top == bottom == 0:
+        return clip
+    fmt = clip.format
+    if hasattr(core, 'akarin') and fmt is not None and 0 not in (clip.width, clip.height):
+        # One pass over the frame instead of materializing the cropped
+        # intermediate just to pad it back. Fill values and per-plane
+        # coordinates replicate what Crop+AddBorders would produce.
+        exprs = []
+        for p in range(fmt.num_planes):
+            ssw, ssh = (fmt.subsampling_w, fmt.subsampling_h) if p else (0, 0)
+            w, h = clip.width >> ssw, clip.height >> ssh
+            if p and fmt.color_family == vs.YUV:
+                fill = '0.0' if fmt.sample_type == vs.FLOAT else str(1 << (fmt.bits_per_sample - 1))
+            else:
+                fill = '0'
+            exprs.append(
+                f'X {left >> ssw} < X {w - (right >> ssw)} >= or '
+                f'Y {top >> ssh} < or Y {h - (bottom >> ssh)} >= or {fill} x ?'
+            )
+        return core.akarin.Expr(clip, exprs)
     return clip.std.Crop(left, right, top, bottom).std.AddBorders(left, right, top, bottom)
 
 
@@ -199,12 +277,23 @@ def region_abs_mask(clip: vs.VideoNode, width: int, height: int, left: int = 0,
     :return:            Regionned mask
     """
     def _crop(c: vs.VideoNode, w: int, h: int) -> vs.VideoNode:
+        if (w, h, left, top) == (width, height, 0, 0):
+            return c
         return c.std.CropAbs(width, height, left, top).std.AddBorders(
             left, w - width - left, top, h - height - top
         )
 
     if 0 in {clip.width, clip.height}:
+        # Variable-size clips usually cycle through a handful of resolutions;
+        # memoizing per dimension pair keeps the per-frame callback to a dict
+        # lookup instead of building a new Crop/AddBorders subgraph each frame.
+        crops: Dict[Tuple[int, int], vs.VideoNode] = {}
+
         def _region(n: int, f: vs.VideoFrame, c: vs.VideoNode) -> vs.VideoNode:
-            return _crop(c, f.width, f.height)
+            key = (f.width, f.height)
+            try:
+                return crops[key]
+            except KeyError:
+                return crops.setdefault(key, _crop(c, *key))
         return clip.std.FrameEval(partial(_region, c=clip), clip)
     return _crop(clip, clip.width, clip.height)